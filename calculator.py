@@ -1,8 +1,17 @@
+import operator
 import tkinter as tk
 from tkinter import font
 
 
 class Calculator(tk.Tk):
+    # Operator symbol -> function applied to (stored_value, current value)
+    _OPS = {
+        '+': operator.add,
+        '-': operator.sub,
+        '*': operator.mul,
+        '/': operator.truediv,
+    }
+
     def __init__(self):
         super().__init__()
         self.title("Calculator")
@@ -15,6 +24,7 @@ class Calculator(tk.Tk):
 
         # Variables
         self.current_input = tk.StringVar(value="0")
+        self._buf = "0"  # display text; pushed to current_input once per click
         self.operation = None
         self.stored_value = 0
         self.reset_screen = False
@@ -34,8 +44,10 @@ class Calculator(tk.Tk):
             relief="flat",
             justify="right",
             bg="#3D3D3D",
+            readonlybackground="#3D3D3D",
             fg="white",
-            insertbackground="white"
+            insertbackground="white",
+            state="readonly"  # input comes from the buttons only
         )
         display.pack(fill="x", ipady=10)
 
@@ -69,50 +81,58 @@ class Calculator(tk.Tk):
             button_frame.grid_rowconfigure(i, weight=1)
 
     def _on_button_click(self, symbol):
-        current = self.current_input.get()
-
+        # Work on the plain Python buffer and push it to the display once
         if symbol in '0123456789':
-            if current == '0' or self.reset_screen:
-                self.current_input.set(symbol)
+            if self._buf == '0' or self.reset_screen:
+                self._buf = symbol
                 self.reset_screen = False
             else:
-                self.current_input.set(current + symbol)
+                self._buf += symbol
 
         elif symbol == 'C':
-            self.current_input.set("0")
+            self._buf = "0"
             self.stored_value = 0
             self.operation = None
 
         elif symbol in '+-*/':
             if self.operation and not self.reset_screen:
+                # _calculate() leaves the result in stored_value
                 self._calculate()
-            self.stored_value = float(current)
-            self.operation = symbol
-            self.reset_screen = True
+            elif self._buf != "Error":
+                self.stored_value = float(self._buf)
+
+            # After "Error" there is nothing to operate on until a new number
+            if self._buf != "Error":
+                self.operation = symbol
+                self.reset_screen = True
 
         elif symbol == '=':
             if self.operation:
                 self._calculate()
                 self.operation = None
 
+        self.current_input.set(self._buf)
+
     def _calculate(self):
+        op = self._OPS.get(self.operation)
+        if op is None:
+            return
         try:
-            current = float(self.current_input.get())
-            if self.operation == '+':
-                result = self.stored_value + current
-            elif self.operation == '-':
-                result = self.stored_value - current
-            elif self.operation == '*':
-                result = self.stored_value * current
-            elif self.operation == '/':
-                result = self.stored_value / current
-
-            self.current_input.set(str(result))
-            self.stored_value = result
-            self.reset_screen = True
+            result = op(self.stored_value, float(self._buf))
         except ZeroDivisionError:
-            self.current_input.set("Error")
+            self._buf = "Error"
+            self.operation = None
             self.reset_screen = True
+            return
+
+        # Show whole numbers without a trailing ".0" while every digit is still
+        # exact (below 2**53); otherwise use the float's shortest repr
+        if result.is_integer() and abs(result) < 2 ** 53:
+            self._buf = str(int(result))
+        else:
+            self._buf = repr(result)
+        self.stored_value = result
+        self.reset_screen = True
 
 
 if __name__ == "__main__":
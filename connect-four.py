@@ -1,5 +1,5 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import font, messagebox
 
 class ConnectFour(tk.Tk):
     """
@@ -28,6 +28,22 @@ class ConnectFour(tk.Tk):
     RED = "red"
     YELLOW = "gold"       # "yellow" can look dull; "gold" reads nicer
 
+    # Only two turn messages exist, so build them once
+    _TURN_TEXT = {RED: "Player's Turn: Red", YELLOW: "Player's Turn: Yellow"}
+
+    # ---------- Bitboard layout ----------
+    # Each player's discs live in one int. Bit (col * H1 + h) is the disc at
+    # height h (0 = bottom) in column col. Every column gets one spare
+    # "sentinel" bit on top so lines can never wrap into the next column.
+    H1 = ROWS + 1
+    SHIFTS = (1, H1, H1 - 1, H1 + 1)  # vertical, horizontal, both diagonals
+
+    # Every playable cell set (sentinel bits left clear): a full board
+    FULL_MASK = 0
+    for _col in range(COLS):
+        FULL_MASK |= ((1 << ROWS) - 1) << (_col * H1)
+    del _col
+
     def __init__(self):
         super().__init__()
 
@@ -38,25 +54,34 @@ class ConnectFour(tk.Tk):
         # Compute canvas size from constants so the geometry matches the board
         self.canvas_w = self.COLS * self.CELL
         self.canvas_h = self.ROWS * self.CELL
+        self._cell = self.CELL  # instance copy: cheaper to look up per mouse event
         total_w = self.canvas_w + self.PADDING * 2
         total_h = self.TOP_BAR_H + self.canvas_h + self.STATUS_H + self.PADDING * 2
 
         # Set a precise geometry string like "widthxheight"
         self.geometry(f"{total_w}x{total_h}")
 
+        # Fonts are created once and shared, so Tk never re-parses a font spec
+        self._label_font = font.Font(family="Helvetica", size=16, weight="bold")
+        self._button_font = font.Font(family="Helvetica", size=12)
+        self._small_font = font.Font(family="Helvetica", size=10)
+
         # ----- Game state -----
-        # Board is a 2D list (ROWS x COLS) storing None, "red", or "gold"
-        self.board = [[None for _ in range(self.COLS)] for _ in range(self.ROWS)]
+        # One bitboard per player plus the number of discs in each column
+        self.bb_red = 0
+        self.bb_yellow = 0
+        self.heights = [0] * self.COLS
         self.current_player = self.RED
         self.game_over = False
-        self.win_coords = []  # list of (row, col) that form the winning line
+        self.win_coords = ()  # (row, col) cells that form the winning line
 
         # Track hover column to draw a subtle highlight
         self.hover_col = None
+        self._redraw_pending = False  # True while a hover redraw is queued
 
-        # Build UI and draw initial board
+        # Build UI and create the (persistent) board items once
         self._create_ui()
-        self._draw_board()
+        self._init_static_items()
 
     # ---------------------- UI Construction ----------------------
     def _create_ui(self):
@@ -73,7 +98,8 @@ class ConnectFour(tk.Tk):
         self.turn_label = tk.Label(
             self.top_frame,
             text=self._turn_text(),
-            font=("Helvetica", 16, "bold"),
+            font=self._label_font,
+            fg=self.current_player,
             bg="white"
         )
         self.turn_label.pack(side="left")
@@ -82,7 +108,7 @@ class ConnectFour(tk.Tk):
             self.top_frame,
             text="Reset Game",
             command=self.reset_game,
-            font=("Helvetica", 12),
+            font=self._button_font,
             bg="#EAEAEA",
             activebackground="#DDDDDD"
         )
@@ -98,11 +124,16 @@ class ConnectFour(tk.Tk):
         )
         self.canvas.pack(padx=self.PADDING, pady=4)
 
+        # Talk to Tcl directly for board items (cell images, hover moves):
+        # the canvas.create_*() / coords() wrappers flatten options on every call.
+        self._tk_call = self.canvas.tk.call
+        self._cw = self.canvas._w
+
         # Status bar (small instruction text at the bottom)
         self.status = tk.Label(
             self,
             text="Click a column to drop a disc. Press 'R' to reset.",
-            font=("Helvetica", 10),
+            font=self._small_font,
             anchor="w"
         )
         self.status.pack(fill="x", padx=self.PADDING, pady=(4, self.PADDING))
@@ -113,98 +144,145 @@ class ConnectFour(tk.Tk):
         self.bind("<Key>", self._on_key)
 
     # ---------------------- Drawing Helpers ----------------------
-    def _draw_board(self):
+    def _make_sprite(self, disc_color=None, outlined=False):
         """
-        Redraw the entire board:
-        - Clear canvas
-        - Draw slots (white circles) on the blue background
-        - Draw any placed discs
-        - Draw hover column highlight (if any)
-        - If someone won, outline those 4 discs to make it obvious
+        Render one CELL x CELL board cell as an image: a white slot, plus a
+        disc of `disc_color` inside it (if given). Pixels outside the slot are
+        left unset (transparent) so the board and hover highlight show through.
+        `outlined` adds the thick black ring used to mark winning discs.
+        Pixels are written straight into a PhotoImage, so no extra libraries
+        are needed.
         """
-        self.canvas.delete("all")
-
-        cell_w = self.CELL
-        cell_h = self.CELL
+        size = self.CELL
+        half = size / 2
+        slot_r2 = (half - self.SLOT_MARGIN - 1) ** 2  # -1 keeps the old slot outline
+        disc_r = half - self.DISC_MARGIN
+        disc_r2 = disc_r ** 2
+        # A 4px ring centered on the disc edge
+        ring_in2 = (disc_r - 2) ** 2
+        ring_out2 = (disc_r + 2) ** 2
+
+        image = tk.PhotoImage(width=size, height=size)
+        for y in range(size):
+            dy = y + 0.5 - half
+            row = []
+            start = None  # x of the first painted pixel in this row
+            for x in range(size):
+                dx = x + 0.5 - half
+                d2 = dx * dx + dy * dy
+                if outlined and ring_in2 <= d2 <= ring_out2:
+                    color = "black"
+                elif disc_color and d2 <= disc_r2:
+                    color = disc_color
+                elif d2 <= slot_r2:
+                    color = "white"
+                else:
+                    continue  # outside the circles: leave transparent
+                if start is None:
+                    start = x
+                row.append(color)
+            # The painted pixels of a row form one centered run
+            if row:
+                image.put("{" + " ".join(row) + "}", to=(start, y))
+        return image
+
+    def _init_static_items(self):
+        """
+        Create every canvas item the game will ever need, exactly once:
+        - Hover column highlight (hidden until the mouse is over the board)
+        - One image per cell (an empty slot until a disc is dropped there)
 
-        # Optional: draw a subtle rounded rectangle as board background (visual only)
-        # Here we already use a solid bg color, so slots will "punch through" as white circles.
+        After this, moves only swap cell images instead of deleting and
+        redrawing the whole board.
+        """
+        tk_call = self._tk_call
+        cw = self._cw
+
+        # Pre-rendered cell sprites (kept on self so Tk doesn't lose them)
+        self._img_empty = self._make_sprite()
+        self._img_red = self._make_sprite(self.RED)
+        self._img_yellow = self._make_sprite(self.YELLOW)
+        self._img_red_win = self._make_sprite(self.RED, outlined=True)
+        self._img_yellow_win = self._make_sprite(self.YELLOW, outlined=True)
+
+        # Hover column highlight (light overlay rectangle), drawn first so it
+        # only shows through the transparent corners of the cell sprites.
+        # Its coords are moved as the mouse moves.
+        self._hover_id = tk_call(
+            cw, "create", "rectangle", 0, 0, self.CELL, self.canvas_h,
+            "-fill", "#ffffff", "-stipple", "gray25", "-outline", "",
+            "-state", "hidden"
+        )
 
-        # Draw hover column highlight (light overlay rectangle)
-        if self.hover_col is not None and not self.game_over:
-            x1 = self.hover_col * cell_w
-            x2 = x1 + cell_w
-            self.canvas.create_rectangle(
-                x1, 0, x2, self.canvas_h,
-                fill="#ffffff", stipple="gray25", outline=""
-            )
-
-        # Draw the grid of slots and any discs present
+        # Cells: each shows the empty, red, or yellow sprite
+        self._cell_ids = [[None] * self.COLS for _ in range(self.ROWS)]
         for row in range(self.ROWS):
             for col in range(self.COLS):
-                x1 = col * cell_w
-                y1 = row * cell_h
-                x2 = x1 + cell_w
-                y2 = y1 + cell_h
-
-                # White slot (hole)
-                self.canvas.create_oval(
-                    x1 + self.SLOT_MARGIN, y1 + self.SLOT_MARGIN,
-                    x2 - self.SLOT_MARGIN, y2 - self.SLOT_MARGIN,
-                    fill="white", outline=self.BOARD_BG, width=2
+                self._cell_ids[row][col] = tk_call(
+                    cw, "create", "image", col * self.CELL, row * self.CELL,
+                    "-anchor", "nw", "-image", self._img_empty, "-tags", "cell"
                 )
 
-                # If a disc is placed here, draw it as a filled circle
-                color = self.board[row][col]
-                if color:
-                    self.canvas.create_oval(
-                        x1 + self.DISC_MARGIN, y1 + self.DISC_MARGIN,
-                        x2 - self.DISC_MARGIN, y2 - self.DISC_MARGIN,
-                        fill=color, outline=color
-                    )
-
-        # If there's a win, outline those four discs
-        if self.win_coords:
-            for (r, c) in self.win_coords:
-                x1 = c * cell_w
-                y1 = r * cell_h
-                x2 = x1 + cell_w
-                y2 = y1 + cell_h
-                self.canvas.create_oval(
-                    x1 + self.DISC_MARGIN, y1 + self.DISC_MARGIN,
-                    x2 - self.DISC_MARGIN, y2 - self.DISC_MARGIN,
-                    outline="black", width=4
-                )
+    def _update_hover(self):
+        """Move the hover highlight to the hovered column, or hide it."""
+        # Runs on every hover change, so skip Tkinter's wrappers and call Tcl
+        tk_call = self._tk_call
+        cw = self._cw
+        if self.hover_col is not None and not self.game_over:
+            x1 = self.hover_col * self._cell
+            tk_call(cw, "coords", self._hover_id, x1, 0, x1 + self._cell, self.canvas_h)
+            tk_call(cw, "itemconfigure", self._hover_id, "-state", "normal")
+        else:
+            tk_call(cw, "itemconfigure", self._hover_id, "-state", "hidden")
 
-        # Update the turn label color to match the current player
-        self.turn_label.config(text=self._turn_text(), fg=self.current_player)
+    def _show_disc(self, row, col, color):
+        """Show a disc of the given color in the cell at (row, col)."""
+        image = self._img_red if color == self.RED else self._img_yellow
+        self.canvas.itemconfigure(self._cell_ids[row][col], image=image)
+
+    def _highlight_winner(self, winner):
+        """Outline the winning discs to make the 4-in-a-row obvious."""
+        image = self._img_red_win if winner == self.RED else self._img_yellow_win
+        for (r, c) in self.win_coords:
+            self.canvas.itemconfigure(self._cell_ids[r][c], image=image)
 
     def _turn_text(self):
         """Return a user-friendly 'Player's Turn' string."""
-        return f"Player's Turn: {'Red' if self.current_player == self.RED else 'Yellow'}"
+        return self._TURN_TEXT[self.current_player]
 
     # ---------------------- Event Handlers ----------------------
     def _on_motion(self, event):
         """
         Track the mouse x-position to compute the column under the cursor.
         We use this to draw a translucent highlight for that column.
+
+        Motion events arrive for every pixel the mouse moves, so the actual
+        redraw is deferred to the next idle cycle; a fast sweep across several
+        columns then costs a single redraw.
         """
         if self.game_over:
-            self.hover_col = None
-            self._draw_board()
+            col = None
+        else:
+            # Convert mouse x coordinate to column index; also guard bounds
+            x = event.x
+            if 0 <= x < self.canvas_w:
+                col = x // self._cell
+            else:
+                # Mouse moved outside the board area (to the sides)
+                col = None
+
+        if col == self.hover_col:
             return
 
-        # Convert mouse x coordinate to column index; also guard bounds
-        col = event.x // self.CELL
-        if 0 <= col < self.COLS:
-            if col != self.hover_col:
-                self.hover_col = col
-                self._draw_board()
-        else:
-            # Mouse moved outside the board area (to the sides)
-            if self.hover_col is not None:
-                self.hover_col = None
-                self._draw_board()
+        self.hover_col = col
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        """Apply the latest hover column queued by _on_motion."""
+        self._redraw_pending = False
+        self._update_hover()
 
     def _on_key(self, event):
         """Keyboard shortcuts: 'r' to reset the game."""
@@ -222,95 +300,111 @@ class ConnectFour(tk.Tk):
             return
 
         # Determine clicked column; ignore clicks outside the board
-        col = event.x // self.CELL
-        if not (0 <= col < self.COLS):
+        x = event.x
+        if not (0 <= x < self.canvas_w):
             return
-
-        # Find the lowest empty row in this column (from bottom up)
-        target_row = None
-        for row in range(self.ROWS - 1, -1, -1):
-            if not self.board[row][col]:
-                target_row = row
-                break
+        col = x // self._cell
 
         # Column is full
-        if target_row is None:
+        height = self.heights[col]
+        if height == self.ROWS:
             messagebox.showinfo("Column Full", "Try a different column.")
             return
 
-        # Place the disc, redraw, and check for result
-        self.board[target_row][col] = self.current_player
-        winner, win_coords = self._check_winner(target_row, col)
+        # The disc lands on top of the column (rows are counted from the top)
+        target_row = self.ROWS - 1 - height
+        self.heights[col] = height + 1
+        bit = 1 << (col * self.H1 + height)
+        if self.current_player == self.RED:
+            self.bb_red |= bit
+            bb = self.bb_red
+        else:
+            self.bb_yellow |= bit
+            bb = self.bb_yellow
+
+        # Show the disc and check for result
+        self._show_disc(target_row, col, self.current_player)
+        winner, win_coords = self._check_winner(bb)
+        result = None
         if winner:
             self.game_over = True
             self.win_coords = win_coords
-            self._draw_board()
-            messagebox.showinfo("Game Over", f"{'Red' if winner == self.RED else 'Yellow'} player wins!")
-            return
-
-        if self._is_board_full():
+            self._highlight_winner(winner)
+            self._update_hover()
+            result = f"{'Red' if winner == self.RED else 'Yellow'} player wins!"
+        elif self._is_board_full():
             self.game_over = True
-            self._draw_board()
-            messagebox.showinfo("Game Over", "It's a draw!")
-            return
+            self._update_hover()
+            result = "It's a draw!"
+        else:
+            # Switch player and refresh UI
+            self.current_player = self.YELLOW if self.current_player == self.RED else self.RED
+            self.turn_label.config(text=self._turn_text(), fg=self.current_player)
 
-        # Switch player and refresh UI
-        self.current_player = self.YELLOW if self.current_player == self.RED else self.RED
-        self._draw_board()
+        # Paint everything this move changed in one go (before any dialog)
+        self.canvas.update_idletasks()
+        if result:
+            messagebox.showinfo("Game Over", result)
 
     # ---------------------- Game Logic ----------------------
-    def _check_winner(self, row, col):
+    def _check_winner(self, bb):
         """
-        Check if placing a disc at (row, col) creates a 4-in-a-row.
-        Returns (winning_color, coords_list) or (None, []).
+        Check if the current player's bitboard `bb` contains a 4-in-a-row.
+        Returns (winning_color, coords_list) or (None, ()).
+
+        For each direction, `bb & (bb >> shift)` keeps discs that have a
+        neighbour one step away; doing it again with 2 * shift keeps only
+        the starts of runs of four.
         """
-        color = self.current_player  # we just placed this color
-        directions = [
-            (0, 1),   # Horizontal
-            (1, 0),   # Vertical
-            (1, 1),   # Diagonal down-right
-            (1, -1)   # Diagonal down-left
-        ]
-
-        for dr, dc in directions:
-            coords = [(row, col)]  # start with the current piece
-
-            # Check in the positive direction (dr, dc)
-            r, c = row + dr, col + dc
-            while 0 <= r < self.ROWS and 0 <= c < self.COLS and self.board[r][c] == color:
-                coords.append((r, c))
-                r += dr
-                c += dc
-
-            # Check in the negative direction (-dr, -dc)
-            r, c = row - dr, col - dc
-            while 0 <= r < self.ROWS and 0 <= c < self.COLS and self.board[r][c] == color:
-                coords.append((r, c))
-                r -= dr
-                c -= dc
-
-            if len(coords) >= 4:
-                # We found a winning line
-                return color, coords
-
-        return None, []
+        for shift in self.SHIFTS:
+            m = bb & (bb >> shift)
+            m &= m >> (2 * shift)
+            if m:
+                return self.current_player, self._run_coords(m, shift)
 
-    def _is_board_full(self):
+        return None, ()
+
+    def _run_coords(self, starts, shift):
         """
-        The board is full if the top row has no empty cells.
-        We only need to check the top row for speed.
+        Turn the run-start bits found by _check_winner into (row, col) cells.
+        Only called on a win, so the common no-win path never builds lists.
         """
-        return all(self.board[0][c] is not None for c in range(self.COLS))
+        # Collect every disc covered by a run (there may be 5+ in a row)
+        run = 0
+        while starts:
+            low = starts & -starts
+            run |= low | (low << shift) | (low << 2 * shift) | (low << 3 * shift)
+            starts ^= low
+
+        rows, h1 = self.ROWS, self.H1
+        coords = []
+        while run:
+            low = run & -run
+            col, height = divmod(low.bit_length() - 1, h1)
+            coords.append((rows - 1 - height, col))
+            run ^= low
+        return coords
+
+    def _is_board_full(self):
+        """The board is full once both bitboards together cover every cell."""
+        return (self.bb_red | self.bb_yellow) == self.FULL_MASK
 
     def reset_game(self):
         """Reset the board and UI to start a new game."""
-        self.board = [[None for _ in range(self.COLS)] for _ in range(self.ROWS)]
+        self.bb_red = 0
+        self.bb_yellow = 0
+        for i in range(self.COLS):
+            self.heights[i] = 0
         self.current_player = self.RED
         self.game_over = False
-        self.win_coords = []
+        self.win_coords = ()
         self.hover_col = None
         self.turn_label.config(text=self._turn_text(), fg=self.current_player)
-        self._draw_board()
+
+        # Turn every cell (winning ones included) back into an empty slot
+        self.canvas.itemconfigure("cell", image=self._img_empty)
+        self._update_hover()
+        self.canvas.update_idletasks()
 
 # ---------------------- Main Entry Point ----------------------
 if __name__ == "__main__":
@@ -1,12 +1,12 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import font, messagebox
 
 class TicTacToe(tk.Tk):
     """
     A simple Tic-Tac-Toe game built with Tkinter.
 
     Features:
-    - 3x3 grid buttons for moves
+    - 3x3 board drawn on a single canvas
     - Player turn indicator (X vs O)
     - Win detection + line highlighting
     - Draw detection
@@ -18,8 +18,19 @@ class TicTacToe(tk.Tk):
     SIZE = 3               # 3x3 board
     X = "X"                # Player 1 marker
     O = "O"                # Player 2 marker
-    FONT = ("Helvetica", 28, "bold")  # big font for the grid
     BG_COLOR = "#f0f0f0"
+    CELL = 110             # pixel size of each square on the board
+    GRID_COLOR = "#444444"
+    X_COLOR = "red"
+    O_COLOR = "blue"
+
+    # Every winning line as three (row, col) cells: rows, columns, diagonals.
+    # Built once so _check_winner doesn't rebuild coordinates on each move.
+    _LINES = (
+        tuple(((r, 0), (r, 1), (r, 2)) for r in range(SIZE))
+        + tuple(((0, c), (1, c), (2, c)) for c in range(SIZE))
+        + (((0, 0), (1, 1), (2, 2)), ((0, 2), (1, 1), (2, 0)))
+    )
 
     def __init__(self):
         super().__init__()
@@ -29,17 +40,25 @@ class TicTacToe(tk.Tk):
         self.resizable(False, False)
         self.configure(bg=self.BG_COLOR)
 
+        # ----- Fonts (created once and shared by every widget) -----
+        self._grid_font = font.Font(family="Helvetica", size=28, weight="bold")
+        self._label_font = font.Font(family="Helvetica", size=16, weight="bold")
+        self._button_font = font.Font(family="Helvetica", size=12)
+        self._small_font = font.Font(family="Helvetica", size=10)
+
         # ----- Game State -----
         self.current_player = self.X
         self.board = [[None for _ in range(self.SIZE)] for _ in range(self.SIZE)]
         self.game_over = False
+        self._moves = 0            # markers placed since the last reset
+        self._highlighted = False  # True while a winning line is highlighted
 
         # ----- Build UI -----
         self._create_ui()
 
     # ------------------ UI ------------------
     def _create_ui(self):
-        """Create the top bar, 3x3 button grid, and status bar."""
+        """Create the top bar, 3x3 board canvas, and status bar."""
         # Top frame (turn label + reset button)
         top_frame = tk.Frame(self, bg="white", height=50)
         top_frame.pack(fill="x", padx=10, pady=5)
@@ -47,7 +66,7 @@ class TicTacToe(tk.Tk):
         self.turn_label = tk.Label(
             top_frame,
             text=self._turn_text(),
-            font=("Helvetica", 16, "bold"),
+            font=self._label_font,
             bg="white"
         )
         self.turn_label.pack(side="left", padx=10)
@@ -56,37 +75,56 @@ class TicTacToe(tk.Tk):
             top_frame,
             text="Reset Game",
             command=self.reset_game,
-            font=("Helvetica", 12),
+            font=self._button_font,
             bg="#EAEAEA",
             activebackground="#DDDDDD"
         )
         reset_btn.pack(side="right", padx=10)
 
-        # Grid of buttons (the board)
-        self.buttons = []
-        grid_frame = tk.Frame(self, bg=self.BG_COLOR)
-        grid_frame.pack(padx=10, pady=10)
+        # The board: one canvas instead of a widget per square
+        size_px = self.SIZE * self.CELL
+        self.canvas = tk.Canvas(
+            self,
+            width=size_px,
+            height=size_px,
+            bg="white",
+            highlightthickness=0
+        )
+        self.canvas.pack(padx=10, pady=10)
 
+        # Per-square background (used for win highlighting) and marker text
+        self._bg_ids = []
+        self._text_ids = []
         for r in range(self.SIZE):
-            row_buttons = []
+            bg_row = []
+            text_row = []
             for c in range(self.SIZE):
-                btn = tk.Button(
-                    grid_frame,
-                    text="",
-                    font=self.FONT,
-                    width=5,
-                    height=2,
-                    command=lambda r=r, c=c: self._on_click(r, c)
-                )
-                btn.grid(row=r, column=c, padx=5, pady=5)
-                row_buttons.append(btn)
-            self.buttons.append(row_buttons)
+                x1 = c * self.CELL
+                y1 = r * self.CELL
+                bg_row.append(self.canvas.create_rectangle(
+                    x1, y1, x1 + self.CELL, y1 + self.CELL,
+                    fill="", outline="", tags="cell_bg"
+                ))
+                text_row.append(self.canvas.create_text(
+                    x1 + self.CELL // 2, y1 + self.CELL // 2,
+                    text="", font=self._grid_font, tags="cell_text"
+                ))
+            self._bg_ids.append(bg_row)
+            self._text_ids.append(text_row)
+
+        # Grid lines between the squares
+        for i in range(1, self.SIZE):
+            pos = i * self.CELL
+            self.canvas.create_line(pos, 0, pos, size_px, fill=self.GRID_COLOR, width=3)
+            self.canvas.create_line(0, pos, size_px, pos, fill=self.GRID_COLOR, width=3)
+
+        self.canvas.bind("<Button-1>", self._on_canvas_click)
 
         # Status bar (instructions)
         self.status = tk.Label(
             self,
             text="Click a square to make a move. Press 'R' to reset.",
-            font=("Helvetica", 10),
+            font=self._small_font,
             anchor="w",
             bg=self.BG_COLOR
         )
@@ -96,8 +134,15 @@ class TicTacToe(tk.Tk):
         self.bind("<Key>", self._on_key)
 
     # ------------------ Event Handlers ------------------
+    def _on_canvas_click(self, event):
+        """Map a click on the board canvas to the square under the mouse."""
+        row = event.y // self.CELL
+        col = event.x // self.CELL
+        if 0 <= row < self.SIZE and 0 <= col < self.SIZE:
+            self._on_click(row, col)
+
     def _on_click(self, row, col):
-        """Handle a button press at (row, col)."""
+        """Handle a move at (row, col)."""
         if self.game_over:
             return
 
@@ -107,7 +152,9 @@ class TicTacToe(tk.Tk):
 
         # Place the marker (X or O)
         self.board[row][col] = self.current_player
-        self.buttons[row][col].config(text=self.current_player)
+        self._moves += 1
+        color = self.X_COLOR if self.current_player == self.X else self.O_COLOR
+        self.canvas.itemconfigure(self._text_ids[row][col], text=self.current_player, fill=color)
 
         # Check for win or draw
         winner, coords = self._check_winner()
@@ -135,49 +182,47 @@ class TicTacToe(tk.Tk):
     def _check_winner(self):
         """
         Check rows, columns, and diagonals for a winner.
-        Returns (winner, coords) where coords is list of (r,c) of the winning line.
+        Returns (winner, coords) where coords is a tuple of (r,c) of the winning line,
+        or (None, ()) when nobody has won yet.
         """
         b = self.board
-        s = self.SIZE
-
-        # Check rows
-        for r in range(s):
-            if b[r][0] and all(b[r][c] == b[r][0] for c in range(s)):
-                return b[r][0], [(r, c) for c in range(s)]
-
-        # Check columns
-        for c in range(s):
-            if b[0][c] and all(b[r][c] == b[0][c] for r in range(s)):
-                return b[0][c], [(r, c) for r in range(s)]
+        for line in self._LINES:
+            (r1, c1), (r2, c2), (r3, c3) = line
+            v = b[r1][c1]
+            if v and v == b[r2][c2] == b[r3][c3]:
+                return v, line
 
-        # Check main diagonal
-        if b[0][0] and all(b[i][i] == b[0][0] for i in range(s)):
-            return b[0][0], [(i, i) for i in range(s)]
-
-        # Check anti-diagonal
-        if b[0][s-1] and all(b[i][s-1-i] == b[0][s-1] for i in range(s)):
-            return b[0][s-1], [(i, s-1-i) for i in range(s)]
-
-        return None, []
+        return None, ()
 
     def _is_board_full(self):
         """Return True if every square is filled."""
-        return all(self.board[r][c] is not None for r in range(self.SIZE) for c in range(self.SIZE))
+        return self._moves == self.SIZE * self.SIZE
 
     def _highlight_winner(self, coords):
         """Highlight the winning 3 cells with green background."""
+        # Tag the winning squares, then color them all in one call
         for (r, c) in coords:
-            self.buttons[r][c].config(bg="lightgreen")
+            self.canvas.addtag_withtag("win", self._bg_ids[r][c])
+        self.canvas.itemconfigure("win", fill="lightgreen")
+        self._highlighted = True
 
     def reset_game(self):
         """Reset the game state and clear the board."""
-        self.board = [[None for _ in range(self.SIZE)] for _ in range(self.SIZE)]
+        for row in self.board:
+            for i in range(self.SIZE):
+                row[i] = None
         self.current_player = self.X
         self.game_over = False
 
-        for r in range(self.SIZE):
-            for c in range(self.SIZE):
-                self.buttons[r][c].config(text="", bg="SystemButtonFace")
+        # Clear markers and the win highlight with tagged canvas calls,
+        # skipping whichever of them has nothing on screen to clear
+        if self._moves:
+            self.canvas.itemconfigure("cell_text", text="")
+            self._moves = 0
+        if self._highlighted:
+            self.canvas.itemconfigure("win", fill="")
+            self.canvas.dtag("win", "win")
+            self._highlighted = False
 
         self.turn_label.config(text=self._turn_text())
 